@@ -3,7 +3,7 @@
 
 from apify_client import ApifyClient
 from app.utils.config import settings
-from app.utils.helpers import parse_follower_count, clean_username
+from app.utils.helpers import parse_follower_count, clean_username, extract_email_from_bio
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import asyncio
@@ -18,6 +18,9 @@ from random import shuffle
 # monitoring helper (your monitoring module)
 from app.core.monitoring import record_run
 
+# Obfuscated addresses like "name @ mail . com"; plain ones go through helpers
+_SPACED_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}\s*@\s*[A-Za-z0-9.-]{1,253}\s*\.\s*[A-Za-z]{2,24}\b')
+
 class ApifyScraper:
     def __init__(self):
         self.client = ApifyClient(settings.APIFY_API_TOKEN)
@@ -433,15 +436,12 @@ class ApifyScraper:
     def _extract_email_from_bio(self, bio: str) -> Optional[str]:
         if not bio:
             return None
-        patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.\s*[A-Z|a-z]{2,}\b'
-        ]
-        for p in patterns:
-            found = re.findall(p, bio)
-            if found:
-                return re.sub(r'\s', '', found[0])
-        return None
+        email = extract_email_from_bio(bio)
+        if email:
+            return email
+        # Fall back to addresses written with spaces, e.g. "name @ mail . com"
+        match = _SPACED_EMAIL_RE.search(bio)
+        return ''.join(match.group(0).split()) if match else None
 
     def _extract_phone_from_bio(self, bio: str) -> Optional[str]:
         if not bio:
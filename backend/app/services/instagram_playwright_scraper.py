@@ -6,6 +6,7 @@ import random
 import re
 from datetime import datetime
 import logging
+from app.utils.helpers import extract_email_from_bio
 
 class InstagramPlaywrightScraper:
     def __init__(self):
@@ -478,12 +479,7 @@ class InstagramPlaywrightScraper:
 
     def _extract_email_from_bio(self, bio: str) -> Optional[str]:
         """Extract email address from bio text"""
-        if not bio:
-            return None
-        # Email regex pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, bio)
-        return emails[0] if emails else None
+        return extract_email_from_bio(bio)
 
     def _calculate_engagement_rate(self, posts: List[Dict], follower_count: int) -> float:
         """Calculate engagement rate from posts"""
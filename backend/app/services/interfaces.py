@@ -70,6 +70,6 @@ class SessionService(ABC):
         pass
     
     @abstractmethod
-    async def save_cookies(self, cookies: List[Dict]) -> None:
-        """Save session cookies"""
+    async def save_cookies(self, cookies: List[Dict]) -> bool:
+        """Save session cookies, returning whether the write succeeded"""
         pass
\ No newline at end of file
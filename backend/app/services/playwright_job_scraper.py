@@ -1,22 +1,327 @@
 # app/services/playwright_job_scraper.py
 
 from playwright.async_api import async_playwright, TimeoutError
-from app.services.proxy_manager import proxy_manager
+from app.services.proxy_manager import get_proxy_manager
 from app.services.session_manager import session_manager
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
+import ahocorasick
 import asyncio
+import functools
+import hashlib
+import json
 import random
 import re
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 import logging
-from urllib.parse import quote_plus, urljoin
+from urllib.parse import quote_plus, urlencode, urljoin
+
+logger = logging.getLogger(__name__)
+
+# Card extractors run through `locator.evaluate_all`, which hands the already
+# matched card elements to the function, so the source is shipped once per
+# page instead of re-walking the DOM from `document`.
+_INDEED_CARD_SELECTOR = '[data-jk], .job_seen_beacon'
+_INDEED_EXTRACT_JS = '''
+(cards) => cards.slice(0, 10).map(card => {
+    try {
+        const titleEl = card.querySelector('h2 a span[title], .jobTitle a span[title]');
+        const titleLinkEl = card.querySelector('h2 a, .jobTitle a');
+        const companyEl = card.querySelector('[data-testid="company-name"], .companyName');
+        if (!titleEl || !companyEl) return null;
+
+        const locationEl = card.querySelector('[data-testid="job-location"], .companyLocation');
+        const descEl = card.querySelector('.job-snippet, [data-testid="job-snippet"]');
+        const salaryEl = card.querySelector('.salary-snippet, [data-testid="attribute_snippet_testid"]');
+        const dateEl = card.querySelector('.date, [data-testid="myJobsStateDate"]');
+
+        let jobUrl = '';
+        const href = titleLinkEl ? titleLinkEl.getAttribute('href') : null;
+        if (href) {
+            jobUrl = href.startsWith('http') ? href : 'https://www.indeed.com' + href;
+        }
+
+        return {
+            title: titleEl.getAttribute('title') || titleEl.textContent.trim(),
+            company: companyEl.textContent.trim(),
+            location: locationEl ? locationEl.textContent.trim() : '',
+            description: descEl ? descEl.textContent.trim() : '',
+            salary: salaryEl ? salaryEl.textContent.trim() : '',
+            postedDate: dateEl ? dateEl.textContent.trim() : '',
+            jobUrl
+        };
+    } catch (e) {
+        console.log('Error processing job card:', e);
+        return null;
+    }
+}).filter(Boolean)
+'''
+
+_GLASSDOOR_CARD_SELECTOR = '[data-test="job-listing"], .react-job-listing'
+_GLASSDOOR_EXTRACT_JS = '''
+(cards) => cards.slice(0, 8).map(card => {
+    try {
+        const titleEl = card.querySelector('[data-test="job-title"], .jobTitle');
+        const companyEl = card.querySelector('[data-test="employer-name"], .employerName');
+        if (!titleEl || !companyEl) return null;
+
+        const locationEl = card.querySelector('[data-test="job-location"], .location');
+        const salaryEl = card.querySelector('.salaryEstimate, [data-test="salary-estimate"]');
+        const ratingEl = card.querySelector('.companyRating, [data-test="rating"]');
+        const linkEl = card.querySelector('a[data-test="job-title"], .jobTitle a');
+
+        let jobUrl = '';
+        const href = linkEl ? linkEl.getAttribute('href') : null;
+        if (href) {
+            jobUrl = href.startsWith('http') ? href : 'https://www.glassdoor.com' + href;
+        }
+
+        return {
+            title: titleEl.textContent.trim(),
+            company: companyEl.textContent.trim(),
+            location: locationEl ? locationEl.textContent.trim() : '',
+            salary: salaryEl ? salaryEl.textContent.trim() : '',
+            rating: ratingEl ? ratingEl.textContent.trim() : '',
+            jobUrl
+        };
+    } catch (e) {
+        console.log('Error processing Glassdoor job:', e);
+        return null;
+    }
+}).filter(Boolean)
+'''
+
+_GOOGLE_CARD_SELECTORS = (
+    '.tM9F2e',  # Main job card selector
+    '.PwjeAc',  # Alternative selector
+    '[data-ved][role="listitem"]'  # Broader selector
+)
+_GOOGLE_EXTRACT_JS = '''
+(cards) => cards.slice(0, 6).map(card => {
+    try {
+        const titleEl = card.querySelector('.BjJfJf, .vNEEBe, h3');
+        const companyEl = card.querySelector('.vNEEBe .nJlQNd, .uMdZh, .nJlQNd');
+        if (!titleEl || !companyEl) return null;
+
+        const locationEl = card.querySelector('.Qk80Jf, .sMzDkb');
+        const linkEl = card.querySelector('a');
+
+        let jobUrl = '';
+        if (linkEl) {
+            jobUrl = linkEl.getAttribute('href') || '';
+            if (jobUrl.startsWith('/url?q=')) {
+                // Extract actual URL from Google redirect
+                const urlMatch = jobUrl.match(/url\\?q=([^&]+)/);
+                if (urlMatch) {
+                    jobUrl = decodeURIComponent(urlMatch[1]);
+                }
+            }
+        }
+
+        return {
+            title: titleEl.textContent.trim(),
+            company: companyEl.textContent.trim(),
+            location: locationEl ? locationEl.textContent.trim() : '',
+            jobUrl
+        };
+    } catch (e) {
+        console.log('Error processing Google job:', e);
+        return null;
+    }
+}).filter(Boolean)
+'''
+
+# Salary and date parsing patterns, compiled once for every card processed
+_SALARY_STRIP_RE = re.compile(r'(a year|annually|per year|/yr|yearly|an hour|hourly|per hour|/hr)', re.IGNORECASE)
+_SALARY_NUM_RE = re.compile(r'\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+_RATING_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)')
+_DIGITS_RE = re.compile(r'(\d+)')
+
+# Browser fingerprints rotated per context. All are Chromium-based (Chrome and
+# Edge) so the user agent stays consistent with the engine we actually launch.
+_CHROME_WIN = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version}.0.0.0 Safari/537.36'
+_CHROME_MAC = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version}.0.0.0 Safari/537.36'
+_EDGE_WIN = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version}.0.0.0 Safari/537.36 Edg/{version}.0.0.0'
+
+FINGERPRINTS = [
+    {'user_agent': _CHROME_WIN.format(version=120), 'viewport': {'width': 1920, 'height': 1080}, 'locale': 'en-US', 'timezone_id': 'America/New_York'},
+    {'user_agent': _CHROME_WIN.format(version=119), 'viewport': {'width': 1366, 'height': 768}, 'locale': 'en-US', 'timezone_id': 'America/Chicago'},
+    {'user_agent': _CHROME_WIN.format(version=121), 'viewport': {'width': 1536, 'height': 864}, 'locale': 'en-US', 'timezone_id': 'America/Los_Angeles'},
+    {'user_agent': _CHROME_WIN.format(version=120), 'viewport': {'width': 1600, 'height': 900}, 'locale': 'en-GB', 'timezone_id': 'Europe/London'},
+    {'user_agent': _CHROME_WIN.format(version=119), 'viewport': {'width': 2560, 'height': 1440}, 'locale': 'en-US', 'timezone_id': 'America/Denver'},
+    {'user_agent': _CHROME_MAC.format(version=120), 'viewport': {'width': 1440, 'height': 900}, 'locale': 'en-US', 'timezone_id': 'America/New_York'},
+    {'user_agent': _CHROME_MAC.format(version=121), 'viewport': {'width': 1680, 'height': 1050}, 'locale': 'en-US', 'timezone_id': 'America/Los_Angeles'},
+    {'user_agent': _CHROME_MAC.format(version=119), 'viewport': {'width': 1280, 'height': 800}, 'locale': 'en-CA', 'timezone_id': 'America/Toronto'},
+    {'user_agent': _CHROME_MAC.format(version=120), 'viewport': {'width': 1512, 'height': 982}, 'locale': 'en-GB', 'timezone_id': 'Europe/London'},
+    {'user_agent': _EDGE_WIN.format(version=120), 'viewport': {'width': 1920, 'height': 1080}, 'locale': 'en-US', 'timezone_id': 'America/Chicago'},
+    {'user_agent': _EDGE_WIN.format(version=119), 'viewport': {'width': 1366, 'height': 768}, 'locale': 'en-US', 'timezone_id': 'America/New_York'},
+    {'user_agent': _EDGE_WIN.format(version=121), 'viewport': {'width': 1536, 'height': 864}, 'locale': 'en-AU', 'timezone_id': 'Australia/Sydney'},
+]
+
+# Job classification keywords, matched as substrings in a single pass per text
+_REMOTE_INDICATORS = (
+    'remote', 'work from home', 'wfh', 'telecommute',
+    'distributed', 'anywhere', 'virtual', 'home office'
+)
+_CONTRACT_INDICATORS = (
+    'contract', 'contractor', 'freelance', 'freelancer',
+    'consultant', 'temporary', 'temp', 'project', 'gig'
+)
+_SENIOR_TERMS = ('senior', 'lead', 'principal', 'architect', 'manager')
+_ENTRY_TERMS = ('junior', 'entry', 'graduate', 'intern')
+_MID_TERMS = ('mid', 'intermediate', '2-4 years', '3-5 years')
+_COMMON_SKILLS = (
+    'python', 'javascript', 'java', 'react', 'node.js', 'sql', 'aws',
+    'docker', 'kubernetes', 'git', 'html', 'css', 'typescript',
+    'angular', 'vue.js', 'php', 'ruby', 'go', 'rust', 'c++',
+    'machine learning', 'data science', 'ai', 'blockchain',
+    'marketing', 'seo', 'content writing', 'graphic design',
+    'project management', 'scrum', 'agile', 'jira'
+)
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one case-insensitive alternation, longest first"""
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, ordered)), re.IGNORECASE)
+
+_REMOTE_RE = _keyword_pattern(_REMOTE_INDICATORS)
+_CONTRACT_RE = _keyword_pattern(_CONTRACT_INDICATORS)
+_SENIOR_RE = _keyword_pattern(_SENIOR_TERMS)
+_ENTRY_RE = _keyword_pattern(_ENTRY_TERMS)
+_MID_RE = _keyword_pattern(_MID_TERMS)
+
+# Skills are matched with Aho-Corasick: one pass over the text finds every
+# (possibly overlapping) skill, independent of the vocabulary size
+_SKILL_AUTOMATON = ahocorasick.Automaton()
+for _skill in _COMMON_SKILLS:
+    _SKILL_AUTOMATON.add_word(_skill, _skill)
+_SKILL_AUTOMATON.make_automaton()
+
+# Experience levels in priority order
+_EXPERIENCE_PATTERNS = (('senior', _SENIOR_RE), ('entry', _ENTRY_RE), ('mid', _MID_RE))
+
+# Inter-platform pacing: short waits while traffic goes through a proxy, with
+# exponential backoff only once a platform answers with a block status
+_BLOCK_STATUSES = (403, 429)
+_BASE_DELAY = 0.5  # Fixed think time added to every wait
+_PROXY_DELAY_RANGE = (2, 5)
+_DIRECT_DELAY_RANGE = (10, 15)  # No proxy to rotate, so stay conservative
+_MAX_FAIL_STREAK = 3
+_PLATFORM_PAUSE = 60  # Seconds a platform is skipped after repeated blocks
+
+# Job type query values per platform
+_INDEED_JOB_TYPES = {
+    'full-time': 'fulltime',
+    'part-time': 'parttime',
+    'contract': 'contract',
+    'freelance': 'contract',
+    'temporary': 'temporary',
+    'internship': 'internship'
+}
+_GLASSDOOR_JOB_TYPES = {
+    'full-time': 'fulltime',
+    'part-time': 'parttime',
+    'contract': 'contract',
+    'freelance': 'contract',
+    'internship': 'internship'
+}
+
+def _map_job_type_indeed(job_type: str) -> str:
+    """Map job type to Indeed parameter"""
+    return _INDEED_JOB_TYPES.get(job_type.lower(), '')
+
+def _map_job_type_glassdoor(job_type: str) -> str:
+    """Map job type to Glassdoor parameter"""
+    return _GLASSDOOR_JOB_TYPES.get(job_type.lower(), '')
+
+def _stable_job_id(platform: str, title: str, company: str) -> str:
+    """Build a job ID that is reproducible across processes (unlike builtin hash)"""
+    digest = hashlib.blake2b(f"{title}|{company}".encode('utf-8'), digest_size=8).hexdigest()
+    return f"{platform}_{digest}"
+
+# Trust score contribution per platform (unknown platforms get 10)
+_PLATFORM_SCORES = {'glassdoor': 25, 'indeed': 20, 'google': 15}
+
+# Listings repeat the same handful of salary strings ("$25 an hour",
+# "$100,000 - $120,000 a year"), so parsed ranges are memoized
+@functools.lru_cache(maxsize=1024)
+def _parse_salary(salary_text: str) -> tuple:
+    """Parse salary range from text"""
+    if not salary_text:
+        return None, None
+        
+    # Remove common salary text
+    salary_clean = _SALARY_STRIP_RE.sub('', salary_text)
+    
+    # Find salary numbers
+    numbers = _SALARY_NUM_RE.findall(salary_clean)
+    
+    if len(numbers) >= 2:
+        try:
+            min_sal = int(numbers[0].replace(',', ''))
+            max_sal = int(numbers[1].replace(',', ''))
+            return min_sal, max_sal
+        except ValueError:
+            pass
+    elif len(numbers) == 1:
+        try:
+            sal = int(numbers[0].replace(',', ''))
+            return sal, sal
+        except ValueError:
+            pass
+            
+    return None, None
+
+# Cookies that are never worth persisting: analytics trackers churn on every
+# visit and near-expired cookies would be stale by the next run anyway
+_TRACKING_COOKIE_PREFIXES = ('_ga', '_gid', '_gcl', '__utm', '_fbp')
+_MIN_COOKIE_TTL = 60
+
+def _persistable_cookies(cookies: List[Dict]) -> List[Dict]:
+    """Filter tracking and soon-to-expire cookies out of a context cookie jar"""
+    cutoff = time.time() + _MIN_COOKIE_TTL
+    return [
+        cookie for cookie in cookies
+        if not cookie.get('name', '').startswith(_TRACKING_COOKIE_PREFIXES)
+        and not 0 <= cookie.get('expires', -1) < cutoff  # -1 marks a session cookie
+    ]
+
+def _cookie_jar_hash(cookies: List[Dict]) -> str:
+    """Content hash of a cookie jar, used to skip rewriting an unchanged jar"""
+    payload = json.dumps(cookies, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+_PROXY_RE = re.compile(r'^(?:(?P<username>[^:@\s]+):(?P<password>[^@\s]+)@)?(?P<host>[\w.-]+):(?P<port>\d{1,5})$')
+
+def _proxy_config(proxy: str) -> Optional[Dict]:
+    """Playwright proxy settings for a 'host:port' or 'user:pass@host:port' proxy, None if malformed"""
+    match = _PROXY_RE.match(proxy)
+    if not match:
+        logger.warning("Invalid proxy format: %s", proxy.rsplit('@', 1)[-1])
+        return None
+    config = {'server': f"http://{match['host']}:{match['port']}"}
+    if match['username']:
+        config['username'] = match['username']
+        config['password'] = match['password']
+    return config
 
 class PlaywrightJobScraper:
+    # Hash of the last jar written by any scraper instance in this process
+    _last_cookie_hash: Optional[str] = None
+    # Per-platform backoff shared by all instances; the router builds a fresh
+    # scraper per request, so per-instance state would reset every scrape.
+    # Only ever mutated in place, never rebound through self.
+    _platform_fail_streak: Dict[str, int] = defaultdict(int)
+    _platform_paused_until: Dict[str, float] = {}
+
     def __init__(self):
         self.playwright = None
         self.browser = None
         self.context = None
         self.current_proxy = None
+        self._blocked_platforms = set()
+        self._warmed_homepages = set()
 
     async def __aenter__(self):
         """Initialize Playwright with proxy and session management"""
@@ -24,7 +329,7 @@ class PlaywrightJobScraper:
             self.playwright = await async_playwright().start()
             
             # Get proxy
-            self.current_proxy = proxy_manager.get_proxy()
+            self.current_proxy = get_proxy_manager().get_proxy()
             
             # Browser launch args with stealth
             launch_args = [
@@ -52,17 +357,12 @@ class PlaywrightJobScraper:
             
             # Add proxy if available
             if self.current_proxy:
-                proxy_parts = self.current_proxy.split(':')
-                if len(proxy_parts) == 2:
-                    proxy_config = {
-                        "server": f"http://{self.current_proxy}"
-                    }
-                else:
-                    proxy_config = None
-                    print(f"⚠️ Invalid proxy format: {self.current_proxy}")
+                proxy_config = _proxy_config(self.current_proxy)
+                if proxy_config is None:
+                    self.current_proxy = None
             else:
                 proxy_config = None
-                print("⚠️ No proxy available")
+                logger.warning("No proxy available")
 
             self.browser = await self.playwright.chromium.launch(
                 headless=False,  # Run headless for job scraping
@@ -70,45 +370,15 @@ class PlaywrightJobScraper:
                 proxy=proxy_config
             )
 
-            # Create context with realistic fingerprint
-            context_options = {
-                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'viewport': {'width': 1920, 'height': 1080},
-                'locale': 'en-US',
-                'timezone_id': 'America/New_York',
-                'permissions': [],
-                'java_script_enabled': True,
-                'ignore_https_errors': True
-            }
+            self.context = await self._new_context()
 
-            self.context = await self.browser.new_context(**context_options)
-
-            # Load saved cookies if available
-            cookies = await session_manager.load_cookies()
-            if cookies:
-                await self.context.add_cookies(cookies)
-
-            # Set extra headers for legitimacy
-            await self.context.set_extra_http_headers({
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Cache-Control': 'max-age=0'
-            })
-
-            print(f"🤖 JobScraper initialized with proxy: {self.current_proxy or 'None'}")
+            logger.info("JobScraper initialized with proxy: %s", self.current_proxy or 'None')
             return self
 
         except Exception as e:
-            print(f"❌ Error initializing JobScraper: {str(e)}")
+            logger.error("Error initializing JobScraper: %s", e)
             if self.current_proxy:
-                proxy_manager.report_failure(self.current_proxy)
+                get_proxy_manager().report_failure(self.current_proxy)
             raise
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -116,9 +386,13 @@ class PlaywrightJobScraper:
         try:
             # Save cookies before closing
             if self.context:
-                cookies = await self.context.cookies()
+                cookies = _persistable_cookies(await self.context.cookies())
                 if cookies:
-                    await session_manager.save_cookies(cookies)
+                    cookie_hash = _cookie_jar_hash(cookies)
+                    if (cookie_hash != PlaywrightJobScraper._last_cookie_hash
+                            and await session_manager.save_cookies(cookies)):
+                        # Only remember jars that reached disk, so a failed write is retried
+                        PlaywrightJobScraper._last_cookie_hash = cookie_hash
                 await self.context.close()
             
             if self.browser:
@@ -128,7 +402,117 @@ class PlaywrightJobScraper:
                 await self.playwright.stop()
 
         except Exception as e:
-            print(f"⚠️ Error during cleanup: {str(e)}")
+            logger.warning("Error during cleanup: %s", e)
+
+    async def _new_context(self, proxy_config: Optional[Dict] = None):
+        """Create a browser context with fingerprint, saved cookies and headers"""
+        # Create context with a realistic fingerprint picked per context
+        fingerprint = random.choice(FINGERPRINTS)
+        context_options = {
+            'user_agent': fingerprint['user_agent'],
+            'viewport': fingerprint['viewport'],
+            'locale': fingerprint['locale'],
+            'timezone_id': fingerprint['timezone_id'],
+            'permissions': [],
+            'java_script_enabled': True,
+            'ignore_https_errors': True
+        }
+
+        if proxy_config:
+            context_options['proxy'] = proxy_config
+
+        context = await self.browser.new_context(**context_options)
+
+        # Load saved cookies if available
+        cookies = await session_manager.load_cookies()
+        if cookies:
+            await context.add_cookies(cookies)
+
+        # Set extra headers for legitimacy
+        await context.set_extra_http_headers({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+            'Accept-Language': f"{fingerprint['locale']},en;q=0.9",
+            'Accept-Encoding': 'gzip, deflate, br',
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Cache-Control': 'max-age=0'
+        })
+
+        return context
+
+    async def _rotate_proxy(self):
+        """Report the current proxy as blocked and move to a fresh context on a new one"""
+        if self.current_proxy:
+            get_proxy_manager().report_failure(self.current_proxy)
+
+        new_proxy = get_proxy_manager().get_proxy()
+        if not new_proxy or new_proxy == self.current_proxy:
+            logger.warning("No alternative proxy available, keeping current context")
+            return
+
+        proxy_config = _proxy_config(new_proxy)
+        if proxy_config is None:
+            logger.warning("Skipping rotation, keeping current context")
+            return
+
+        old_context = self.context
+        self.context = await self._new_context(proxy_config)
+        self.current_proxy = new_proxy
+        self._warmed_homepages.clear()
+        await old_context.close()
+        logger.info("Rotated to proxy: %s", proxy_config['server'])
+
+    async def _goto_with_warmup(self, page, search_url: str, homepage: str):
+        """Navigate like a visitor: homepage first (once per context), then search with referer"""
+        if homepage not in self._warmed_homepages:
+            try:
+                await page.goto(homepage, wait_until='domcontentloaded', timeout=10000)
+                self._warmed_homepages.add(homepage)
+            except Exception as e:
+                logger.warning("Homepage warm-up failed for %s: %s", homepage, e)
+
+        await page.goto(search_url, wait_until='domcontentloaded', referer=homepage, timeout=15000)
+
+    def _watch_for_blocks(self, page, platform: str):
+        """Flag the platform when a page navigation is answered with 403/429"""
+        def on_response(response):
+            if response.status in _BLOCK_STATUSES and response.request.resource_type == 'document':
+                self._blocked_platforms.add(platform)
+
+        page.on('response', on_response)
+
+    async def _handle_platform_result(self, platform: str):
+        """Update the platform's block streak, rotating proxy and pausing as needed"""
+        if platform not in self._blocked_platforms:
+            self._platform_fail_streak[platform] = 0
+            return
+
+        self._blocked_platforms.discard(platform)
+        self._platform_fail_streak[platform] += 1
+        streak = self._platform_fail_streak[platform]
+        logger.warning("%s blocked the request (%d in a row)", platform, streak)
+
+        if streak >= _MAX_FAIL_STREAK:
+            self._platform_paused_until[platform] = time.monotonic() + _PLATFORM_PAUSE
+            logger.warning("Pausing %s for %ds", platform, _PLATFORM_PAUSE)
+
+        await self._rotate_proxy()
+
+    def _next_platform_delay(self, platform: str) -> float:
+        """Delay before the next platform, doubled for each consecutive block (capped)"""
+        low, high = _PROXY_DELAY_RANGE if self.current_proxy else _DIRECT_DELAY_RANGE
+        if self._platform_paused_until.get(platform, 0) > time.monotonic():
+            # The pause already handles a persistently blocking platform; it
+            # should not also hold up the next one
+            backoff = 1
+        else:
+            # The streak survives across requests, so clamp the exponent
+            backoff = 2 ** min(self._platform_fail_streak[platform], _MAX_FAIL_STREAK)
+        return _BASE_DELAY + random.uniform(low, high) * backoff
 
     async def scrape_jobs(
         self,
@@ -141,18 +525,41 @@ class PlaywrightJobScraper:
         """
         Main job scraping orchestrator
         """
-        all_jobs = []
+        return [
+            job async for job in self.scrape_jobs_stream(keywords, location, job_type, max_results, platforms)
+        ]
+
+    async def scrape_jobs_stream(
+        self,
+        keywords: str,
+        location: str = "remote",
+        job_type: str = "contract",
+        max_results: int = 10,
+        platforms: List[str] = ["indeed", "glassdoor", "google"]
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield unique jobs as soon as each platform has been scraped
+        """
+        # Deduplicate by title + company as results arrive, so the platform
+        # loop can stop as soon as enough unique jobs have been yielded
+        seen_jobs = set()
+        found_count = 0
         search_keywords = [kw.strip().lower() for kw in keywords.split() if kw.strip()]
         
-        print(f"🔍 Starting job search: '{keywords}' in '{location}' ({job_type})")
+        logger.info("Starting job search: '%s' in '%s' (%s)", keywords, location, job_type)
         
         for platform in platforms:
-            if len(all_jobs) >= max_results:
+            if found_count >= max_results:
                 break
                 
+            paused_for = self._platform_paused_until.get(platform, 0) - time.monotonic()
+            if paused_for > 0:
+                logger.info("Skipping %s, paused for another %.0fs", platform, paused_for)
+                continue
+                
             try:
-                remaining_count = max_results - len(all_jobs)
-                print(f"📋 Searching {platform.title()} for {remaining_count} jobs...")
+                remaining_count = max_results - found_count
+                logger.info("Searching %s for %d jobs", platform, remaining_count)
                 
                 if platform == "indeed":
                     jobs = await self._scrape_indeed(keywords, location, job_type, remaining_count)
@@ -161,57 +568,56 @@ class PlaywrightJobScraper:
                 elif platform == "google":
                     jobs = await self._scrape_google_jobs(keywords, location, job_type, remaining_count)
                 else:
-                    print(f"⚠️ Platform '{platform}' not supported")
+                    logger.warning("Platform '%s' not supported", platform)
                     continue
                 
-                # Add search keywords to each job
+                new_count = 0
                 for job in jobs:
+                    job_key = (job.get('title', '').lower(), job.get('company_name', '').lower())
+                    if job_key in seen_jobs or job_key == ('', ''):
+                        continue
+                    seen_jobs.add(job_key)
+                    
+                    # Add search keywords to each job
                     job['search_keywords'] = search_keywords
                     job['platform'] = platform
                     job['scraped_at'] = datetime.utcnow().isoformat()
+                    found_count += 1
+                    new_count += 1
+                    yield job
+                    
+                    if found_count >= max_results:
+                        break
                 
-                all_jobs.extend(jobs)
-                print(f"✅ Found {len(jobs)} jobs from {platform}")
+                logger.info("Found %d jobs from %s (%d new)", len(jobs), platform, new_count)
+                await self._handle_platform_result(platform)
                 
-                # Conservative delay between platforms
-                if len(all_jobs) < max_results and platform != platforms[-1]:
-                    delay = random.uniform(30, 45)  # 30-45 second delay
-                    print(f"⏳ Waiting {delay:.1f}s before next platform...")
+                # Adaptive delay between platforms
+                if found_count < max_results and platform != platforms[-1]:
+                    delay = self._next_platform_delay(platform)
+                    logger.debug("Waiting %.1fs before next platform", delay)
                     await asyncio.sleep(delay)
                     
             except Exception as e:
-                print(f"❌ Error scraping {platform}: {str(e)}")
+                logger.error("Error scraping %s: %s", platform, e)
                 if self.current_proxy:
-                    proxy_manager.report_failure(self.current_proxy)
+                    get_proxy_manager().report_failure(self.current_proxy)
                 continue
 
-        # Deduplicate jobs by title + company
-        seen_jobs = set()
-        unique_jobs = []
-        
-        for job in all_jobs:
-            job_key = (job.get('title', '').lower(), job.get('company_name', '').lower())
-            if job_key not in seen_jobs and job_key != ('', ''):
-                seen_jobs.add(job_key)
-                unique_jobs.append(job)
-        
-        # Limit to max_results
-        unique_jobs = unique_jobs[:max_results]
-        
-        print(f"🎯 Total unique jobs found: {len(unique_jobs)}")
-        return unique_jobs
+        logger.info("Total unique jobs found: %d", found_count)
 
     async def _scrape_indeed(self, keywords: str, location: str, job_type: str, limit: int) -> List[Dict]:
         """Scrape Indeed jobs"""
         jobs = []
         try:
             page = await self.context.new_page()
+            self._watch_for_blocks(page, 'indeed')
             
             # Build Indeed search URL
             search_params = {
                 'q': keywords,
                 'l': location if location.lower() != 'remote' else '',
-                'jt': self._map_job_type_indeed(job_type),
+                'jt': _map_job_type_indeed(job_type),
                 'radius': '25',
                 'fromage': '14'  # Last 14 days
             }
@@ -222,93 +628,27 @@ class PlaywrightJobScraper:
             
             # Build URL
             base_url = 'https://www.indeed.com/jobs?'
-            url_params = '&'.join([f"{k}={quote_plus(str(v))}" for k, v in search_params.items() if v])
+            url_params = urlencode({k: v for k, v in search_params.items() if v})
             search_url = base_url + url_params
             
-            print(f"🔗 Indeed URL: {search_url}")
+            logger.debug("Indeed URL: %s", search_url)
             
             # Navigate with stealth
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
+            await self._goto_with_warmup(page, search_url, 'https://www.indeed.com/')
             await asyncio.sleep(random.uniform(3, 6))
             
             # Extract job listings
-            jobs_data = await page.evaluate('''
-            () => {
-                const jobs = [];
-                const jobCards = document.querySelectorAll('[data-jk], .job_seen_beacon');
-                
-                jobCards.forEach((card, index) => {
-                    if (index >= 10) return; // Limit per page
-                    
-                    try {
-                        // Title and link
-                        const titleEl = card.querySelector('h2 a span[title], .jobTitle a span[title]');
-                        const titleLinkEl = card.querySelector('h2 a, .jobTitle a');
-                        
-                        // Company
-                        const companyEl = card.querySelector('[data-testid="company-name"], .companyName');
-                        
-                        // Location
-                        const locationEl = card.querySelector('[data-testid="job-location"], .companyLocation');
-                        
-                        // Description snippet
-                        const descEl = card.querySelector('.job-snippet, [data-testid="job-snippet"]');
-                        
-                        // Salary
-                        const salaryEl = card.querySelector('.salary-snippet, [data-testid="attribute_snippet_testid"]');
-                        
-                        // Date
-                        const dateEl = card.querySelector('.date, [data-testid="myJobsStateDate"]');
-                        
-                        if (titleEl && companyEl) {
-                            const title = titleEl.getAttribute('title') || titleEl.textContent.trim();
-                            const company = companyEl.textContent.trim();
-                            const location = locationEl ? locationEl.textContent.trim() : '';
-                            const description = descEl ? descEl.textContent.trim() : '';
-                            const salary = salaryEl ? salaryEl.textContent.trim() : '';
-                            const postedDate = dateEl ? dateEl.textContent.trim() : '';
-                            
-                            // Build job URL
-                            let jobUrl = '';
-                            if (titleLinkEl) {
-                                const href = titleLinkEl.getAttribute('href');
-                                if (href) {
-                                    jobUrl = href.startsWith('http') ? href : 'https://www.indeed.com' + href;
-                                }
-                            }
-                            
-                            jobs.push({
-                                title,
-                                company,
-                                location,
-                                description,
-                                salary,
-                                postedDate,
-                                jobUrl
-                            });
-                        }
-                    } catch (e) {
-                        console.log('Error processing job card:', e);
-                    }
-                });
-                
-                return jobs;
-            }
-            ''')
+            jobs_data = await page.locator(_INDEED_CARD_SELECTOR).evaluate_all(_INDEED_EXTRACT_JS)
             
-            # Process Indeed jobs
-            for job_data in jobs_data[:limit]:
-                if not job_data.get('title') or not job_data.get('company'):
-                    continue
-                    
-                processed_job = await self._process_indeed_job(job_data)
-                if processed_job:
-                    jobs.append(processed_job)
+            # Process Indeed jobs off the event loop
+            jobs = await asyncio.get_running_loop().run_in_executor(
+                None, self._process_jobs, self._process_indeed_job, jobs_data, limit
+            )
             
             await page.close()
             
         except Exception as e:
-            print(f"❌ Indeed scraping error: {e}")
+            logger.error("Indeed scraping error: %s", e)
             
         return jobs
 
@@ -317,18 +657,27 @@ class PlaywrightJobScraper:
         jobs = []
         try:
             page = await self.context.new_page()
+            self._watch_for_blocks(page, 'glassdoor')
             
             # Build Glassdoor search URL
             location_param = location if location.lower() != 'remote' else 'remote'
-            search_url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={quote_plus(keywords)}&locT=C&locId=&jobType={self._map_job_type_glassdoor(job_type)}&sc.occupationParam={quote_plus(keywords)}"
+            search_params = {
+                'sc.keyword': keywords,
+                'locT': 'C',
+                'locId': '',
+                'jobType': _map_job_type_glassdoor(job_type),
+                'sc.occupationParam': keywords
+            }
             
             if location.lower() in ['remote', 'work from home']:
-                search_url += "&remoteWorkType=1"
+                search_params['remoteWorkType'] = '1'
             
-            print(f"🔗 Glassdoor URL: {search_url}")
+            search_url = 'https://www.glassdoor.com/Job/jobs.htm?' + urlencode(search_params)
+            
+            logger.debug("Glassdoor URL: %s", search_url)
             
             # Navigate
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
+            await self._goto_with_warmup(page, search_url, 'https://www.glassdoor.com/')
             await asyncio.sleep(random.uniform(4, 7))
             
             # Handle potential popups/overlays
@@ -338,69 +687,17 @@ class PlaywrightJobScraper:
                 pass
             
             # Extract jobs
-            jobs_data = await page.evaluate('''
-            () => {
-                const jobs = [];
-                const jobCards = document.querySelectorAll('[data-test="job-listing"], .react-job-listing');
-                
-                jobCards.forEach((card, index) => {
-                    if (index >= 8) return;
-                    
-                    try {
-                        const titleEl = card.querySelector('[data-test="job-title"], .jobTitle');
-                        const companyEl = card.querySelector('[data-test="employer-name"], .employerName');
-                        const locationEl = card.querySelector('[data-test="job-location"], .location');
-                        const salaryEl = card.querySelector('.salaryEstimate, [data-test="salary-estimate"]');
-                        const ratingEl = card.querySelector('.companyRating, [data-test="rating"]');
-                        
-                        if (titleEl && companyEl) {
-                            const title = titleEl.textContent.trim();
-                            const company = companyEl.textContent.trim();
-                            const location = locationEl ? locationEl.textContent.trim() : '';
-                            const salary = salaryEl ? salaryEl.textContent.trim() : '';
-                            const rating = ratingEl ? ratingEl.textContent.trim() : '';
-                            
-                            // Get job URL
-                            let jobUrl = '';
-                            const linkEl = card.querySelector('a[data-test="job-title"], .jobTitle a');
-                            if (linkEl) {
-                                const href = linkEl.getAttribute('href');
-                                if (href) {
-                                    jobUrl = href.startsWith('http') ? href : 'https://www.glassdoor.com' + href;
-                                }
-                            }
-                            
-                            jobs.push({
-                                title,
-                                company,
-                                location,
-                                salary,
-                                rating,
-                                jobUrl
-                            });
-                        }
-                    } catch (e) {
-                        console.log('Error processing Glassdoor job:', e);
-                    }
-                });
-                
-                return jobs;
-            }
-            ''')
+            jobs_data = await page.locator(_GLASSDOOR_CARD_SELECTOR).evaluate_all(_GLASSDOOR_EXTRACT_JS)
             
-            # Process Glassdoor jobs
-            for job_data in jobs_data[:limit]:
-                if not job_data.get('title') or not job_data.get('company'):
-                    continue
-                    
-                processed_job = await self._process_glassdoor_job(job_data)
-                if processed_job:
-                    jobs.append(processed_job)
+            # Process Glassdoor jobs off the event loop
+            jobs = await asyncio.get_running_loop().run_in_executor(
+                None, self._process_jobs, self._process_glassdoor_job, jobs_data, limit
+            )
             
             await page.close()
             
         except Exception as e:
-            print(f"❌ Glassdoor scraping error: {e}")
+            logger.error("Glassdoor scraping error: %s", e)
             
         return jobs
 
@@ -409,6 +706,7 @@ class PlaywrightJobScraper:
         jobs = []
         try:
             page = await self.context.new_page()
+            self._watch_for_blocks(page, 'google')
             
             # Build Google Jobs search URL
             location_param = location if location.lower() != 'remote' else 'anywhere'
@@ -419,10 +717,10 @@ class PlaywrightJobScraper:
                 search_query += " remote"
                 search_url = f"https://www.google.com/search?q={quote_plus(search_query)}&ibp=htl;jobs"
             
-            print(f"🔗 Google Jobs URL: {search_url}")
+            logger.debug("Google Jobs URL: %s", search_url)
             
             # Navigate
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
+            await self._goto_with_warmup(page, search_url, 'https://www.google.com/')
             await asyncio.sleep(random.uniform(3, 6))
             
             # Accept cookies if prompted
@@ -432,119 +730,79 @@ class PlaywrightJobScraper:
             except:
                 pass
             
-            # Extract jobs from Google Jobs widget
-            jobs_data = await page.evaluate('''
-            () => {
-                const jobs = [];
-                
-                // Try multiple selectors for Google Jobs
-                const jobSelectors = [
-                    '.tM9F2e',  // Main job card selector
-                    '.PwjeAc',  // Alternative selector
-                    '[data-ved][role="listitem"]'  // Broader selector
-                ];
-                
-                let jobCards = [];
-                for (const selector of jobSelectors) {
-                    jobCards = document.querySelectorAll(selector);
-                    if (jobCards.length > 0) break;
-                }
-                
-                jobCards.forEach((card, index) => {
-                    if (index >= 6) return; // Limit for Google
-                    
-                    try {
-                        // Try different title selectors
-                        let titleEl = card.querySelector('.BjJfJf, .vNEEBe, h3');
-                        let companyEl = card.querySelector('.vNEEBe .nJlQNd, .uMdZh, .nJlQNd');
-                        let locationEl = card.querySelector('.Qk80Jf, .sMzDkb');
-                        
-                        if (titleEl && companyEl) {
-                            const title = titleEl.textContent.trim();
-                            const company = companyEl.textContent.trim();
-                            const location = locationEl ? locationEl.textContent.trim() : '';
-                            
-                            // Get job URL if available
-                            let jobUrl = '';
-                            const linkEl = card.querySelector('a');
-                            if (linkEl) {
-                                jobUrl = linkEl.getAttribute('href') || '';
-                                if (jobUrl.startsWith('/url?q=')) {
-                                    // Extract actual URL from Google redirect
-                                    const urlMatch = jobUrl.match(/url\?q=([^&]+)/);
-                                    if (urlMatch) {
-                                        jobUrl = decodeURIComponent(urlMatch[1]);
-                                    }
-                                }
-                            }
-                            
-                            jobs.push({
-                                title,
-                                company,
-                                location,
-                                jobUrl
-                            });
-                        }
-                    } catch (e) {
-                        console.log('Error processing Google job:', e);
-                    }
-                });
-                
-                return jobs;
-            }
-            ''')
-            
-            # Process Google jobs
-            for job_data in jobs_data[:limit]:
-                if not job_data.get('title') or not job_data.get('company'):
-                    continue
-                    
-                processed_job = await self._process_google_job(job_data)
-                if processed_job:
-                    jobs.append(processed_job)
+            # Extract jobs from Google Jobs widget, using the first card selector that matches
+            jobs_data = []
+            for selector in _GOOGLE_CARD_SELECTORS:
+                cards = page.locator(selector)
+                if await cards.count() > 0:
+                    jobs_data = await cards.evaluate_all(_GOOGLE_EXTRACT_JS)
+                    break
+            
+            # Process Google jobs off the event loop
+            jobs = await asyncio.get_running_loop().run_in_executor(
+                None, self._process_jobs, self._process_google_job, jobs_data, limit
+            )
             
             await page.close()
             
         except Exception as e:
-            print(f"❌ Google Jobs scraping error: {e}")
+            logger.error("Google Jobs scraping error: %s", e)
             
         return jobs
 
-    async def _process_indeed_job(self, job_data: Dict) -> Optional[Dict]:
+    def _process_jobs(self, processor, jobs_data: List[Dict], limit: int) -> List[Dict]:
+        """Run a platform processor over raw card data (CPU-bound, runs in an executor)"""
+        jobs = []
+        for job_data in jobs_data[:limit]:
+            if not job_data.get('title') or not job_data.get('company'):
+                continue
+                
+            processed_job = processor(job_data)
+            if processed_job:
+                jobs.append(processed_job)
+        return jobs
+
+    def _process_indeed_job(self, job_data: Dict) -> Optional[Dict]:
         """Process Indeed job data"""
         try:
+            title = job_data.get('title', '')
+            company = job_data.get('company', '')
+            location = job_data.get('location', '')
+            description = job_data.get('description', '')
+            salary = job_data.get('salary', '')
+            
             # Parse salary
-            salary_min, salary_max = self._parse_salary(job_data.get('salary', ''))
+            salary_min, salary_max = _parse_salary(salary)
             
             # Determine job characteristics
-            is_remote = self._is_remote_job(job_data.get('location', ''), job_data.get('description', ''))
-            is_contract = self._is_contract_job(job_data.get('title', ''), job_data.get('description', ''))
+            is_remote = self._is_remote_job(location, description)
+            is_contract = self._is_contract_job(title, description)
             
             # Calculate trust score
             trust_score = self._calculate_trust_score(
-                company=job_data.get('company', ''),
-                description=job_data.get('description', ''),
-                salary_range=job_data.get('salary', ''),
+                company=company,
+                description=description,
+                salary_range=salary,
                 has_benefits=bool(salary_min),  # If salary is listed, more legitimate
                 platform='indeed'
             )
             
             # Extract skills and requirements
-            skills = self._extract_skills(job_data.get('description', ''))
-            experience_level = self._determine_experience_level(job_data.get('title', ''), job_data.get('description', ''))
+            skills = self._extract_skills(description)
+            experience_level = self._determine_experience_level(title, description)
             
             return {
-                'job_id': f"indeed_{hash(job_data.get('title', '') + job_data.get('company', ''))}",
-                'title': job_data.get('title', ''),
-                'company_name': job_data.get('company', ''),
-                'location': job_data.get('location', ''),
+                'job_id': _stable_job_id('indeed', title, company),
+                'title': title,
+                'company_name': company,
+                'location': location,
                 'is_remote_friendly': is_remote,
                 'job_type': 'contract' if is_contract else 'full-time',
                 'is_contract_work': is_contract,
-                'salary_range': job_data.get('salary', ''),
+                'salary_range': salary,
                 'salary_min': salary_min,
                 'salary_max': salary_max,
-                'description': job_data.get('description', ''),
+                'description': description,
                 'requirements': [],
                 'skills': skills,
                 'posted_date': self._parse_date(job_data.get('postedDate', '')),
@@ -558,41 +816,46 @@ class PlaywrightJobScraper:
             }
             
         except Exception as e:
-            print(f"❌ Error processing Indeed job: {e}")
+            logger.error("Error processing Indeed job: %s", e)
             return None
 
-    async def _process_glassdoor_job(self, job_data: Dict) -> Optional[Dict]:
+    def _process_glassdoor_job(self, job_data: Dict) -> Optional[Dict]:
         """Process Glassdoor job data"""
         try:
+            title = job_data.get('title', '')
+            company = job_data.get('company', '')
+            location = job_data.get('location', '')
+            salary = job_data.get('salary', '')
+            
             # Parse salary
-            salary_min, salary_max = self._parse_salary(job_data.get('salary', ''))
+            salary_min, salary_max = _parse_salary(salary)
             
             # Glassdoor characteristics
-            is_remote = self._is_remote_job(job_data.get('location', ''), '')
-            is_contract = self._is_contract_job(job_data.get('title', ''), '')
+            is_remote = self._is_remote_job(location, '')
+            is_contract = self._is_contract_job(title, '')
             
             # Higher trust score for Glassdoor (company reviews available)
             trust_score = self._calculate_trust_score(
-                company=job_data.get('company', ''),
+                company=company,
                 description='',
-                salary_range=job_data.get('salary', ''),
+                salary_range=salary,
                 has_benefits=bool(salary_min),
                 platform='glassdoor',
                 company_rating=job_data.get('rating', '')
             )
             
-            skills = self._extract_skills(job_data.get('title', ''))
-            experience_level = self._determine_experience_level(job_data.get('title', ''), '')
+            skills = self._extract_skills(title)
+            experience_level = self._determine_experience_level(title, '')
             
             return {
-                'job_id': f"glassdoor_{hash(job_data.get('title', '') + job_data.get('company', ''))}",
-                'title': job_data.get('title', ''),
-                'company_name': job_data.get('company', ''),
-                'location': job_data.get('location', ''),
+                'job_id': _stable_job_id('glassdoor', title, company),
+                'title': title,
+                'company_name': company,
+                'location': location,
                 'is_remote_friendly': is_remote,
                 'job_type': 'contract' if is_contract else 'full-time',
                 'is_contract_work': is_contract,
-                'salary_range': job_data.get('salary', ''),
+                'salary_range': salary,
                 'salary_min': salary_min,
                 'salary_max': salary_max,
                 'description': f"Company Rating: {job_data.get('rating', 'N/A')}",
@@ -609,32 +872,36 @@ class PlaywrightJobScraper:
             }
             
         except Exception as e:
-            print(f"❌ Error processing Glassdoor job: {e}")
+            logger.error("Error processing Glassdoor job: %s", e)
             return None
 
-    async def _process_google_job(self, job_data: Dict) -> Optional[Dict]:
+    def _process_google_job(self, job_data: Dict) -> Optional[Dict]:
         """Process Google job data"""
         try:
-            is_remote = self._is_remote_job(job_data.get('location', ''), '')
-            is_contract = self._is_contract_job(job_data.get('title', ''), '')
+            title = job_data.get('title', '')
+            company = job_data.get('company', '')
+            location = job_data.get('location', '')
+            
+            is_remote = self._is_remote_job(location, '')
+            is_contract = self._is_contract_job(title, '')
             
             # Medium trust score for Google (aggregated from multiple sources)
             trust_score = self._calculate_trust_score(
-                company=job_data.get('company', ''),
+                company=company,
                 description='',
                 salary_range='',
                 has_benefits=False,
                 platform='google'
             )
             
-            skills = self._extract_skills(job_data.get('title', ''))
-            experience_level = self._determine_experience_level(job_data.get('title', ''), '')
+            skills = self._extract_skills(title)
+            experience_level = self._determine_experience_level(title, '')
             
             return {
-                'job_id': f"google_{hash(job_data.get('title', '') + job_data.get('company', ''))}",
-                'title': job_data.get('title', ''),
-                'company_name': job_data.get('company', ''),
-                'location': job_data.get('location', ''),
+                'job_id': _stable_job_id('google', title, company),
+                'title': title,
+                'company_name': company,
+                'location': location,
                 'is_remote_friendly': is_remote,
                 'job_type': 'contract' if is_contract else 'full-time',
                 'is_contract_work': is_contract,
@@ -655,164 +922,77 @@ class PlaywrightJobScraper:
             }
             
         except Exception as e:
-            print(f"❌ Error processing Google job: {e}")
+            logger.error("Error processing Google job: %s", e)
             return None
 
-    def _map_job_type_indeed(self, job_type: str) -> str:
-        """Map job type to Indeed parameter"""
-        mapping = {
-            'full-time': 'fulltime',
-            'part-time': 'parttime',
-            'contract': 'contract',
-            'freelance': 'contract',
-            'temporary': 'temporary',
-            'internship': 'internship'
-        }
-        return mapping.get(job_type.lower(), '')
-
-    def _map_job_type_glassdoor(self, job_type: str) -> str:
-        """Map job type to Glassdoor parameter"""
-        mapping = {
-            'full-time': 'fulltime',
-            'part-time': 'parttime', 
-            'contract': 'contract',
-            'freelance': 'contract',
-            'internship': 'internship'
-        }
-        return mapping.get(job_type.lower(), '')
-
-    def _parse_salary(self, salary_text: str) -> tuple:
-        """Parse salary range from text"""
-        if not salary_text:
-            return None, None
-            
-        # Remove common salary text
-        salary_clean = re.sub(r'(a year|annually|per year|/yr|yearly)', '', salary_text, flags=re.IGNORECASE)
-        salary_clean = re.sub(r'(an hour|hourly|per hour|/hr)', '', salary_clean, flags=re.IGNORECASE)
-        
-        # Find salary numbers
-        numbers = re.findall(r'\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', salary_clean)
-        
-        if len(numbers) >= 2:
-            try:
-                min_sal = int(numbers[0].replace(',', ''))
-                max_sal = int(numbers[1].replace(',', ''))
-                return min_sal, max_sal
-            except:
-                pass
-        elif len(numbers) == 1:
-            try:
-                sal = int(numbers[0].replace(',', ''))
-                return sal, sal
-            except:
-                pass
-                
-        return None, None
-
     def _is_remote_job(self, location: str, description: str) -> bool:
         """Determine if job is remote-friendly"""
-        remote_indicators = [
-            'remote', 'work from home', 'wfh', 'telecommute', 
-            'distributed', 'anywhere', 'virtual', 'home office'
-        ]
-        
-        text = f"{location} {description}".lower()
-        return any(indicator in text for indicator in remote_indicators)
+        return bool(_REMOTE_RE.search(location) or _REMOTE_RE.search(description))
 
     def _is_contract_job(self, title: str, description: str) -> bool:
         """Determine if job is contract/freelance work"""
-        contract_indicators = [
-            'contract', 'contractor', 'freelance', 'freelancer',
-            'consultant', 'temporary', 'temp', 'project', 'gig'
-        ]
-        
-        text = f"{title} {description}".lower()
-        return any(indicator in text for indicator in contract_indicators)
+        return bool(_CONTRACT_RE.search(title) or _CONTRACT_RE.search(description))
 
     def _calculate_trust_score(self, company: str, description: str, salary_range: str, 
                              has_benefits: bool, platform: str, company_rating: str = '') -> int:
         """Calculate trust score 0-100"""
-        score = 30  # Base score
+        # Base score plus platform reliability
+        score = 30 + _PLATFORM_SCORES.get(platform, 10)
         
-        # Platform reliability
-        platform_scores = {'glassdoor': 25, 'indeed': 20, 'google': 15}
-        score += platform_scores.get(platform, 10)
+        # Company name quality (avoid obvious scams), salary transparency
+        # and description quality; bools add as 0/1
+        score += 15 * (len(company) > 3 and company.replace(' ', '').isalpha())
+        score += 15 * bool(salary_range) + 10 * bool(has_benefits)
+        score += 10 * (len(description) > 100)
         
-        # Company name quality (avoid obvious scams)
-        if len(company) > 3 and company.replace(' ', '').isalpha():
-            score += 15
-        
-        # Salary transparency
-        if salary_range:
-            score += 15
-        if has_benefits:
-            score += 10
-        
-        # Company rating (Glassdoor)
-        if company_rating:
-            try:
-                rating = float(company_rating.split()[0])
-                if rating >= 4.0:
-                    score += 10
-                elif rating >= 3.5:
-                    score += 5
-            except:
-                pass
-        
-        # Description quality
-        if len(description) > 100:
-            score += 10
+        # Company rating (Glassdoor), e.g. "4.2 ★"
+        rating_match = _RATING_RE.match(company_rating) if company_rating else None
+        if rating_match:
+            rating = float(rating_match.group(1))
+            if rating >= 4.0:
+                score += 10
+            elif rating >= 3.5:
+                score += 5
         
         return min(100, max(0, score))
 
     def _extract_skills(self, text: str) -> List[str]:
         """Extract relevant skills from job text"""
-        common_skills = [
-            'python', 'javascript', 'java', 'react', 'node.js', 'sql', 'aws',
-            'docker', 'kubernetes', 'git', 'html', 'css', 'typescript',
-            'angular', 'vue.js', 'php', 'ruby', 'go', 'rust', 'c++',
-            'machine learning', 'data science', 'ai', 'blockchain',
-            'marketing', 'seo', 'content writing', 'graphic design',
-            'project management', 'scrum', 'agile', 'jira'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = [skill for skill in common_skills if skill in text_lower]
-        return found_skills[:10]  # Limit to top 10
+        found_skills = {}
+        for _, skill in _SKILL_AUTOMATON.iter(text.lower()):
+            found_skills[skill] = None
+            if len(found_skills) >= 10:  # Limit to top 10
+                break
+        return list(found_skills)
 
     def _determine_experience_level(self, title: str, description: str) -> str:
         """Determine experience level from job text"""
-        text = f"{title} {description}".lower()
-        
-        if any(term in text for term in ['senior', 'lead', 'principal', 'architect', 'manager']):
-            return 'senior'
-        elif any(term in text for term in ['junior', 'entry', 'graduate', 'intern']):
-            return 'entry'
-        elif any(term in text for term in ['mid', 'intermediate', '2-4 years', '3-5 years']):
-            return 'mid'
-        else:
-            return 'unknown'
+        for level, pattern in _EXPERIENCE_PATTERNS:
+            if pattern.search(title) or pattern.search(description):
+                return level
+        return 'unknown'
 
     def _parse_date(self, date_text: str) -> Optional[datetime]:
         """Parse job posting date"""
         if not date_text:
             return None
             
+        date_lower = date_text.lower()
         try:
             # Handle "X days ago" format
-            if 'day' in date_text.lower():
-                days_match = re.search(r'(\d+)', date_text)
+            if 'day' in date_lower:
+                days_match = _DIGITS_RE.search(date_text)
                 if days_match:
                     days_ago = int(days_match.group(1))
                     return datetime.utcnow() - timedelta(days=days_ago)
             
             # Handle "today", "yesterday"
-            if 'today' in date_text.lower():
+            if 'today' in date_lower:
                 return datetime.utcnow()
-            elif 'yesterday' in date_text.lower():
+            elif 'yesterday' in date_lower:
                 return datetime.utcnow() - timedelta(days=1)
                 
         except Exception as e:
-            print(f"⚠️ Error parsing date '{date_text}': {e}")
+            logger.debug("Error parsing date '%s': %s", date_text, e)
             
         return None
\ No newline at end of file
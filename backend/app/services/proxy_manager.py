@@ -1,23 +1,33 @@
 # app/services/proxy_manager.py
+import bisect
+import functools
+import itertools
 import logging
 import threading
 import time
 import random
-import requests
-from typing import Optional, Dict, List, Tuple
+import re
+from typing import Optional, Deque, Dict, List, Tuple
+from collections import deque
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import asyncio
 import aiohttp
 
+from app.services.interfaces import ProxyService
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# ip:port entries in free proxy lists; also skips HTML error pages and comments
+_PROXY_LINE_RE = re.compile(r'\b(\d{1,3}(?:\.\d{1,3}){3}:\d{1,5})\b')
+
+@dataclass(slots=True)
 class ProxyMetrics:
     """Track proxy performance metrics"""
     failures: int = 0
     successes: int = 0
-    response_times: List[float] = None
+    response_times: Deque[float] = None
+    response_time_sum: float = 0.0
     last_used: float = 0
     is_quarantined: bool = False
     quarantine_end: float = 0
@@ -26,7 +36,21 @@ class ProxyMetrics:
     
     def __post_init__(self):
         if self.response_times is None:
-            self.response_times = []
+            self.response_times = deque(maxlen=50)
+    
+    def record_response_time(self, response_time: float):
+        """Append a response time, keeping the running sum in step with deque eviction"""
+        history = self.response_times
+        if history.maxlen is not None and len(history) == history.maxlen:
+            self.response_time_sum -= history[0]
+        history.append(response_time)
+        self.response_time_sum += response_time
+    
+    def avg_response_time(self) -> float:
+        """Average of the response time history in O(1)"""
+        if not self.response_times:
+            return float('inf')
+        return self.response_time_sum / len(self.response_times)
 
 class ProxyProvider(ABC):
     """Abstract base class for proxy providers"""
@@ -50,17 +74,22 @@ class FreeProxyProvider(ProxyProvider):
     async def fetch_proxies(self) -> List[str]:
         all_proxies = []
         async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-            for url in self.urls:
+            async def fetch_one(url: str) -> str:
                 try:
                     async with session.get(url) as response:
-                        if response.status == 200:
-                            text = await response.text()
-                            proxies = [p.strip() for p in text.strip().split('\n') if p.strip()]
-                            all_proxies.extend(proxies)
-                            logger.info(f"[Proxy] Fetched {len(proxies)} proxies from {url}")
+                        return await response.text() if response.status == 200 else ''
                 except Exception as e:
                     logger.warning(f"[Proxy] Failed to fetch from {url}: {e}")
-        return list(set(all_proxies))  # Remove duplicates
+                    return ''
+            
+            # Download all lists in parallel over the one session
+            texts = await asyncio.gather(*(fetch_one(url) for url in self.urls))
+        
+        for url, text in zip(self.urls, texts):
+            proxies = _PROXY_LINE_RE.findall(text)
+            all_proxies.extend(proxies)
+            logger.info(f"[Proxy] Fetched {len(proxies)} proxies from {url}")
+        return list(dict.fromkeys(all_proxies))  # Remove duplicates, keep source order
     
     def get_name(self) -> str:
         return "FreeProxyProvider"
@@ -90,7 +119,7 @@ class PaidProxyProvider(ProxyProvider):
     def get_name(self) -> str:
         return f"PaidProxyProvider({self.api_url})"
 
-class AdvancedProxyManager:
+class AdvancedProxyManager(ProxyService):
     """Advanced proxy manager with multiple sources, validation, and intelligent rotation"""
     
     def __init__(self, config: Dict):
@@ -100,13 +129,22 @@ class AdvancedProxyManager:
         self.lock = threading.RLock()  # Reentrant lock for complex operations
         self.rotation_pool: List[str] = []
         self.weighted_pool: List[Tuple[str, float]] = []
+        # Immutable (proxies, cumulative weights) pair, swapped whole on rebuild so
+        # get_next_proxy can read it without taking the lock
+        self._pool_snapshot: Tuple[Tuple[str, ...], Tuple[float, ...]] = ((), ())
+        self._pool_dirty = False  # Set when a quarantine invalidates the pool; rebuilt on next selection
         self.last_fetch_time = 0
+        self._refresh_retry_at = 0  # After a failed refresh, no background retry before this time
+        self._refresh_task: Optional[asyncio.Task] = None
         self.fetch_interval = config.get('fetch_interval', 300)  # 5 minutes
+        self.refresh_retry_interval = config.get('refresh_retry_interval', 60)
         self.min_pool_size = config.get('min_pool_size', 10)
+        self.target_pool_size = config.get('target_pool_size', self.min_pool_size * 3)
         self.max_failures = config.get('max_failures', 3)
         self.quarantine_duration = config.get('quarantine_duration', 600)  # 10 minutes
         self.validation_timeout = config.get('validation_timeout', 5)
         self.max_response_time_history = config.get('max_response_time_history', 50)
+        self.validation_concurrency = config.get('validation_concurrency', 50)
         
         # Initialize providers
         self._initialize_providers()
@@ -121,12 +159,7 @@ class AdvancedProxyManager:
         ]
     
     def _initialize_providers(self):
-        """Initialize proxy providers from config"""
-        # Free providers
-        free_sources = self.config.get('free_sources', [])
-        if free_sources:
-            self.providers.append(FreeProxyProvider(free_sources))
-        
+        """Initialize proxy providers from config (paid first, so their proxies lead the validation queue)"""
         # Paid providers
         paid_providers = self.config.get('paid_providers', [])
         for provider_config in paid_providers:
@@ -135,33 +168,37 @@ class AdvancedProxyManager:
                 provider_config['api_key'],
                 provider_config.get('format', 'txt')
             ))
+        
+        # Free providers
+        free_sources = self.config.get('free_sources', [])
+        if free_sources:
+            self.providers.append(FreeProxyProvider(free_sources))
     
-    async def validate_proxy(self, proxy: str, test_urls: List[str] = None) -> Tuple[bool, float]:
+    def _new_metrics(self) -> ProxyMetrics:
+        """Create metrics with a response time history bounded by config"""
+        return ProxyMetrics(response_times=deque(maxlen=self.max_response_time_history))
+    
+    async def validate_proxy(
+        self, 
+        session: aiohttp.ClientSession, 
+        proxy: str, 
+        test_urls: List[str] = None
+    ) -> Tuple[bool, float]:
         """Validate proxy with multiple test URLs and return success + response time"""
         if test_urls is None:
             test_urls = ['http://httpbin.org/ip', 'http://icanhazip.com', 'https://api.ipify.org']
         
-        proxy_dict = {
-            'http': f'http://{proxy}',
-            'https': f'http://{proxy}'
-        }
+        proxy_url = f'http://{proxy}'
         
         for test_url in test_urls:
             start_time = time.time()
             try:
-                connector = aiohttp.TCPConnector()
-                timeout = aiohttp.ClientTimeout(total=self.validation_timeout)
-                async with aiohttp.ClientSession(
-                    connector=connector,
-                    timeout=timeout,
-                    headers={'User-Agent': random.choice(self.user_agents)}
-                ) as session:
-                    proxy_url = f'http://{proxy}'
-                    async with session.get(test_url, proxy=proxy_url) as response:
-                        if response.status == 200:
-                            response_time = time.time() - start_time
-                            logger.debug(f"[Proxy] Validated {proxy} - {response_time:.2f}s")
-                            return True, response_time
+                headers = {'User-Agent': random.choice(self.user_agents)}
+                async with session.get(test_url, proxy=proxy_url, headers=headers) as response:
+                    if response.status == 200:
+                        response_time = time.time() - start_time
+                        logger.debug(f"[Proxy] Validated {proxy} - {response_time:.2f}s")
+                        return True, response_time
             except Exception as e:
                 logger.debug(f"[Proxy] Validation failed for {proxy} on {test_url}: {e}")
                 continue
@@ -182,38 +219,49 @@ class AdvancedProxyManager:
             except Exception as e:
                 logger.error(f"[Proxy] Error fetching from {provider.get_name()}: {e}")
         
-        # Remove duplicates
-        unique_proxies = list(set(new_proxies))
+        # Remove duplicates; order is kept so paid proxies are validated first
+        unique_proxies = list(dict.fromkeys(new_proxies))
         logger.info(f"[Proxy] Total unique proxies to validate: {len(unique_proxies)}")
         
-        # Validate proxies in batches
-        batch_size = 20
+        # Validate proxies with bounded concurrency; a new validation starts
+        # as soon as any other finishes
+        semaphore = asyncio.Semaphore(self.validation_concurrency)
         valid_count = 0
         
-        for i in range(0, len(unique_proxies), batch_size):
-            batch = unique_proxies[i:i + batch_size]
-            validation_tasks = [self.validate_proxy(proxy) for proxy in batch]
+        async def bounded_validate(session: aiohttp.ClientSession, proxy: str):
+            async with semaphore:
+                return proxy, await self.validate_proxy(session, proxy)
+        
+        timeout = aiohttp.ClientTimeout(total=self.validation_timeout)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            validation_tasks = [
+                asyncio.create_task(bounded_validate(session, proxy)) 
+                for proxy in unique_proxies
+            ]
             
             try:
-                results = await asyncio.gather(*validation_tasks, return_exceptions=True)
-                
-                for proxy, result in zip(batch, results):
-                    if isinstance(result, Exception):
-                        logger.debug(f"[Proxy] Validation exception for {proxy}: {result}")
-                        continue
+                for next_done in asyncio.as_completed(validation_tasks):
+                    # validate_proxy handles its own request errors
+                    proxy, (is_valid, response_time) = await next_done
                     
-                    is_valid, response_time = result
                     if is_valid:
                         with self.lock:
                             if proxy not in self.proxies:
-                                self.proxies[proxy] = ProxyMetrics()
+                                self.proxies[proxy] = self._new_metrics()
                             # Update initial response time
-                            self.proxies[proxy].response_times.append(response_time)
+                            self.proxies[proxy].record_response_time(response_time)
                             valid_count += 1
                         logger.debug(f"[Proxy] Added valid proxy: {proxy}")
-            
-            except Exception as e:
-                logger.error(f"[Proxy] Batch validation error: {e}")
+                        
+                        # Enough proxies for now; the rest can wait for the next refresh
+                        if valid_count >= self.target_pool_size:
+                            logger.info(f"[Proxy] Reached target pool size {self.target_pool_size}, stopping validation early")
+                            break
+            finally:
+                for task in validation_tasks:
+                    task.cancel()
+                # Let cancelled requests unwind before the session closes under them
+                await asyncio.gather(*validation_tasks, return_exceptions=True)
         
         logger.info(f"[Proxy] Validated {valid_count} proxies successfully")
         return valid_count
@@ -224,7 +272,7 @@ class AdvancedProxyManager:
             return 1.0
         
         success_rate = metrics.successes / metrics.total_requests
-        avg_response_time = sum(metrics.response_times) / len(metrics.response_times) if metrics.response_times else float('inf')
+        avg_response_time = metrics.avg_response_time()
         
         # Normalize response time (consider anything under 2s as good)
         time_score = max(0, 1 - (avg_response_time - 2) / 10) if avg_response_time != float('inf') else 0
@@ -236,8 +284,11 @@ class AdvancedProxyManager:
     def _update_rotation_pool(self):
         """Update rotation pool with weighted random selection"""
         with self.lock:
+            self._pool_dirty = False
             current_time = time.time()
             available_proxies = []
+            append = available_proxies.append
+            calc_score = self._calculate_reliability_score
             
             for proxy, metrics in self.proxies.items():
                 # Check if proxy is quarantined
@@ -250,18 +301,16 @@ class AdvancedProxyManager:
                         continue
                 
                 # Update reliability score
-                metrics.reliability_score = self._calculate_reliability_score(metrics)
-                available_proxies.append((proxy, metrics.reliability_score))
+                reliability = metrics.reliability_score = calc_score(metrics)
+                append((proxy, reliability))
             
             if not available_proxies:
                 logger.warning("[Proxy] No available proxies in pool")
                 self.rotation_pool = []
                 self.weighted_pool = []
+                self._pool_snapshot = ((), ())
                 return
             
-            # Sort by reliability score (descending)
-            available_proxies.sort(key=lambda x: x[1], reverse=True)
-            
             # Create weighted pool with randomization
             total_weight = sum(score for _, score in available_proxies)
             if total_weight > 0:
@@ -274,6 +323,10 @@ class AdvancedProxyManager:
             
             self.rotation_pool = [proxy for proxy, _ in normalized_weights]
             self.weighted_pool = normalized_weights
+            self._pool_snapshot = (
+                tuple(self.rotation_pool),
+                tuple(itertools.accumulate(weight for _, weight in normalized_weights))
+            )
             
             logger.info(f"[Proxy] Updated rotation pool with {len(self.rotation_pool)} proxies")
             
@@ -283,25 +336,40 @@ class AdvancedProxyManager:
     
     def get_next_proxy(self) -> Optional[str]:
         """Get next proxy using weighted random selection"""
-        with self.lock:
-            if not self.weighted_pool:
-                logger.warning("[Proxy] No proxies available in rotation pool")
-                return None
-            
-            # Weighted random selection
-            rand_val = random.random()
-            cumulative_weight = 0
-            
-            for proxy, weight in self.weighted_pool:
-                cumulative_weight += weight
-                if rand_val <= cumulative_weight:
-                    self.proxies[proxy].last_used = time.time()
-                    return proxy
-            
-            # Fallback to last proxy if weights don't add up perfectly
-            proxy = self.weighted_pool[-1][0]
-            self.proxies[proxy].last_used = time.time()
-            return proxy
+        if self._pool_dirty:
+            self._update_rotation_pool()
+        
+        # Lock-free read: rebuilds replace the snapshot with a single assignment
+        proxies, cum_weights = self._pool_snapshot
+        if not cum_weights:
+            logger.warning("[Proxy] No proxies available in rotation pool")
+            return None
+        
+        # Weighted random selection; scaling by the total absorbs float rounding
+        idx = bisect.bisect_left(cum_weights, random.random() * cum_weights[-1])
+        proxy = proxies[idx]
+        metrics = self.proxies.get(proxy)
+        if metrics is not None:
+            metrics.last_used = time.time()  # Advisory only, so no lock
+        return proxy
+    
+    def get_proxy(self) -> Optional[str]:
+        """Get next proxy without blocking; schedules a background refresh when the pool is stale"""
+        now = time.time()
+        if now - self.last_fetch_time > self.fetch_interval and now >= self._refresh_retry_at:
+            self._schedule_refresh()
+        return self.get_next_proxy()
+    
+    def _schedule_refresh(self):
+        """Start a background refresh on the running loop unless one is already in flight"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet (e.g. module import); the next call from async code will schedule it
+            return
+        self._refresh_task = loop.create_task(self.refresh_proxies_if_needed())
     
     def report_success(self, proxy: str, response_time: float):
         """Report successful proxy usage"""
@@ -310,11 +378,7 @@ class AdvancedProxyManager:
                 metrics = self.proxies[proxy]
                 metrics.successes += 1
                 metrics.total_requests += 1
-                metrics.response_times.append(response_time)
-                
-                # Keep response time history bounded
-                if len(metrics.response_times) > self.max_response_time_history:
-                    metrics.response_times.pop(0)
+                metrics.record_response_time(response_time)
                 
                 # Reduce failure count on success
                 metrics.failures = max(0, metrics.failures - 1)
@@ -340,8 +404,9 @@ class AdvancedProxyManager:
                     metrics.quarantine_end = time.time() + self.quarantine_duration
                     logger.warning(f"[Proxy] Quarantined {proxy} for {self.quarantine_duration/60:.1f} minutes")
                     
-                    # Update rotation pool to exclude quarantined proxy
-                    self._update_rotation_pool()
+                    # Exclude the quarantined proxy on the next selection; a burst
+                    # of failures then costs one rebuild instead of one each
+                    self._pool_dirty = True
     
     async def refresh_proxies_if_needed(self):
         """Refresh proxy pool if needed"""
@@ -357,8 +422,10 @@ class AdvancedProxyManager:
                     self._update_rotation_pool()
                     logger.info(f"[Proxy] Refresh complete: {valid_count} valid proxies")
                 else:
-                    logger.warning("[Proxy] No valid proxies found during refresh")
+                    self._refresh_retry_at = time.time() + self.refresh_retry_interval
+                    logger.warning(f"[Proxy] No valid proxies found during refresh, retrying in {self.refresh_retry_interval}s")
             except Exception as e:
+                self._refresh_retry_at = time.time() + self.refresh_retry_interval
                 logger.error(f"[Proxy] Error during proxy refresh: {e}")
     
     def get_proxy_stats(self) -> Dict:
@@ -369,12 +436,10 @@ class AdvancedProxyManager:
             quarantined_proxies = total_proxies - available_proxies
             
             avg_response_time = 0
-            if self.proxies:
-                all_times = []
-                for metrics in self.proxies.values():
-                    all_times.extend(metrics.response_times)
-                if all_times:
-                    avg_response_time = sum(all_times) / len(all_times)
+            sample_count = sum(len(metrics.response_times) for metrics in self.proxies.values())
+            if sample_count:
+                total_time = sum(metrics.response_time_sum for metrics in self.proxies.values())
+                avg_response_time = total_time / sample_count
             
             return {
                 "total_proxies": total_proxies,
@@ -409,12 +474,17 @@ PROXY_CONFIG = {
         # }
     ],
     'fetch_interval': 300,  # 5 minutes
+    'refresh_retry_interval': 60,  # Back-off after a refresh finds nothing
     'min_pool_size': 10,
+    'target_pool_size': 30,
     'max_failures': 3,
     'quarantine_duration': 600,  # 10 minutes
     'validation_timeout': 5,
-    'max_response_time_history': 50
+    'max_response_time_history': 50,
+    'validation_concurrency': 50
 }
 
-# Global instance
-proxy_manager = AdvancedProxyManager(PROXY_CONFIG)
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_proxy_manager() -> ProxyService:
+    """Shared proxy manager, created on first use rather than at import"""
+    return AdvancedProxyManager(PROXY_CONFIG)
\ No newline at end of file
@@ -3,16 +3,37 @@ from typing import Optional, Dict, Any
 import logging
 from app.utils.config import settings
 from app.services.interfaces import InstagramScrapingService, JobScrapingService
-from app.services.proxy_manager import proxy_manager, AdvancedProxyManager
+from app.services.proxy_manager import get_proxy_manager, AdvancedProxyManager
 from app.services.session_manager import session_manager
 
 logger = logging.getLogger(__name__)
 
+# Scraper modules are imported on first use rather than at module top: apify_client
+# is optional, and a missing dependency should only disable that one service.
+# The resolved classes are cached by ServiceFactory, so each loader only runs
+# until it first succeeds.
+
+def _load_apify_scraper() -> type:
+    from app.services.apify_scraper import ApifyScraper
+    return ApifyScraper
+
+def _load_playwright_instagram_scraper() -> type:
+    from app.services.instagram_playwright_scraper import InstagramPlaywrightScraper
+    return InstagramPlaywrightScraper
+
+def _load_playwright_job_scraper() -> type:
+    from app.services.playwright_job_scraper import PlaywrightJobScraper
+    return PlaywrightJobScraper
+
 class ServiceFactory:
     """Factory for creating and managing services"""
     
-    _instagram_services = {}
-    _job_services = {}
+    # Resolved scraper classes, keyed by (service_type, fallback) for Instagram and
+    # service_type for jobs. Classes rather than instances are cached: scrapers are
+    # async context managers holding per-use browser/client state, so each caller
+    # still gets a fresh one.
+    _instagram_services: Dict[tuple, type] = {}
+    _job_services: Dict[str, type] = {}
     
     @classmethod
     def create_instagram_scraper(
@@ -21,66 +42,98 @@ class ServiceFactory:
         fallback: bool = True
     ) -> Optional[InstagramScrapingService]:
         """Create Instagram scraping service with fallback support"""
+        key = (service_type, fallback)
+        scraper_cls = cls._instagram_services.get(key)
         
-        if service_type == "apify":
-            return cls._create_apify_scraper(fallback)
-        elif service_type == "playwright":
-            return cls._create_playwright_instagram_scraper()
-        else:
-            logger.error(f"Unknown Instagram service type: {service_type}")
-            return None
+        if scraper_cls is None:
+            if service_type == "apify":
+                scraper_cls = cls._resolve_apify_scraper(fallback)
+            elif service_type == "playwright":
+                scraper_cls = cls._resolve_playwright_instagram_scraper()
+            else:
+                logger.error(f"Unknown Instagram service type: {service_type}")
+                return None
+            
+            if scraper_cls is None:
+                return None
+            cls._instagram_services[key] = scraper_cls
+        
+        try:
+            return scraper_cls()
+        except Exception as e:
+            logger.error(f"Failed to create {scraper_cls.__name__}: {e}")
+        
+        # Construction failed; fall back to Playwright unless it was Playwright that failed
+        if service_type == "apify" and fallback:
+            fallback_cls = cls._resolve_playwright_instagram_scraper()
+            if fallback_cls is not None and fallback_cls is not scraper_cls:
+                try:
+                    return fallback_cls()
+                except Exception as e:
+                    logger.error(f"Failed to create {fallback_cls.__name__}: {e}")
+        return None
     
     @classmethod
-    def _create_apify_scraper(cls, fallback: bool = True) -> Optional[InstagramScrapingService]:
-        """Create Apify scraper with optional fallback"""
+    def _resolve_apify_scraper(cls, fallback: bool = True) -> Optional[type]:
+        """Resolve the Apify scraper class with optional fallback"""
         try:
             if not settings.APIFY_API_TOKEN:
                 logger.warning("APIFY_API_TOKEN not set - Apify scraper unavailable")
                 if fallback:
-                    return cls._create_playwright_instagram_scraper()
+                    return cls._resolve_playwright_instagram_scraper()
                 return None
             
-            from app.services.apify_scraper import ApifyScraper
-            return ApifyScraper()
+            return _load_apify_scraper()
         except Exception as e:
-            logger.error(f"Failed to create Apify scraper: {e}")
+            logger.error(f"Failed to load Apify scraper: {e}")
             if fallback:
-                return cls._create_playwright_instagram_scraper()
+                return cls._resolve_playwright_instagram_scraper()
             return None
     
     @classmethod
-    def _create_playwright_instagram_scraper(cls) -> Optional[InstagramScrapingService]:
-        """Create Playwright Instagram scraper"""
+    def _resolve_playwright_instagram_scraper(cls) -> Optional[type]:
+        """Resolve the Playwright Instagram scraper class"""
         try:
-            from app.services.instagram_playwright_scraper import InstagramPlaywrightScraper
-            return InstagramPlaywrightScraper()
+            return _load_playwright_instagram_scraper()
         except Exception as e:
-            logger.error(f"Failed to create Playwright Instagram scraper: {e}")
+            logger.error(f"Failed to load Playwright Instagram scraper: {e}")
             return None
     
     @classmethod
     def create_job_scraper(cls, service_type: str = "playwright") -> Optional[JobScrapingService]:
         """Create job scraping service"""
+        scraper_cls = cls._job_services.get(service_type)
         
-        if service_type == "playwright":
-            return cls._create_playwright_job_scraper()
-        else:
-            logger.error(f"Unknown job service type: {service_type}")
+        if scraper_cls is None:
+            if service_type == "playwright":
+                scraper_cls = cls._resolve_playwright_job_scraper()
+            else:
+                logger.error(f"Unknown job service type: {service_type}")
+                return None
+            
+            if scraper_cls is None:
+                return None
+            cls._job_services[service_type] = scraper_cls
+        
+        try:
+            return scraper_cls()
+        except Exception as e:
+            logger.error(f"Failed to create {scraper_cls.__name__}: {e}")
             return None
     
     @classmethod
-    def _create_playwright_job_scraper(cls) -> Optional[JobScrapingService]:
-        """Create Playwright job scraper"""
+    def _resolve_playwright_job_scraper(cls) -> Optional[type]:
+        """Resolve the Playwright job scraper class"""
         try:
-            from app.services.playwright_job_scraper import PlaywrightJobScraper
-            return PlaywrightJobScraper()
+            return _load_playwright_job_scraper()
         except Exception as e:
-            logger.error(f"Failed to create Playwright job scraper: {e}")
+            logger.error(f"Failed to load Playwright job scraper: {e}")
             return None
 
     @classmethod
     def get_available_services(cls) -> Dict[str, Dict[str, bool]]:
         """Get status of available services"""
+        proxy_manager = get_proxy_manager()
         return {
             "instagram": {
                 "apify": bool(settings.APIFY_API_TOKEN),
@@ -2,53 +2,93 @@
 from pathlib import Path
 from typing import Optional, List, Dict
 import json
+import os
+import uuid
 import random
 import asyncio
-from datetime import datetime
+import logging
+import time
+from aiofile import async_open
+
+logger = logging.getLogger(__name__)
+
+# Dedicated generator so refresh jitter does not share the global random state
+_RNG = random.Random()
 
 class SessionManager:
     def __init__(self, cookie_file: str = "cookies.json", refresh_interval_min: int = 8, refresh_interval_max: int = 10):
         self.cookie_file = Path(cookie_file)
-        self.refresh_interval = random.randint(refresh_interval_min, refresh_interval_max)
+        self.refresh_interval_min = refresh_interval_min
+        self.refresh_interval_max = refresh_interval_max
+        self.refresh_interval = self._next_refresh_interval()
         self.run_count = 0
         self.cookies: Optional[List[Dict]] = None
+        self._cookies_mtime: Optional[int] = None  # st_mtime_ns of the file self.cookies came from
         self.lock = asyncio.Lock()
-        self.last_refresh = datetime.now()
+        self.last_refresh = time.monotonic()  # Monotonic seconds; only for measuring intervals
+
+    def _next_refresh_interval(self) -> int:
+        """Draw the number of runs before the next refresh (bounds inclusive)"""
+        return _RNG.randrange(self.refresh_interval_min, self.refresh_interval_max + 1)
 
     async def load_cookies(self) -> Optional[List[Dict]]:
         """Load cookies from file asynchronously."""
-        async with self.lock:
-            if self.cookie_file.exists():
-                try:
-                    with open(self.cookie_file, "r") as f:
-                        self.cookies = json.load(f)
-                    print(f"[SessionManager] Loaded {len(self.cookies)} cookies from {self.cookie_file}")
-                    return self.cookies
-                except Exception as e:
-                    print(f"[SessionManager] Error loading cookies: {str(e)}")
+        try:
+            mtime = self.cookie_file.stat().st_mtime_ns
+        except FileNotFoundError:
             return None
+        
+        # Unchanged since the last load or save: skip the read and parse
+        if self.cookies is not None and mtime == self._cookies_mtime:
+            return self.cookies
+        
+        try:
+            async with async_open(self.cookie_file, "r") as f:
+                cookies = json.loads(await f.read())
+            # Only the in-memory swap is locked; readers never wait on disk I/O
+            async with self.lock:
+                self.cookies = cookies
+                self._cookies_mtime = mtime
+            logger.debug("Loaded %d cookies from %s", len(cookies), self.cookie_file)
+            return cookies
+        except Exception as e:
+            logger.error("Error loading cookies: %s", e)
+        return None
 
-    async def save_cookies(self, cookies: List[Dict]) -> None:
-        """Save cookies to file asynchronously."""
-        async with self.lock:
-            try:
-                with open(self.cookie_file, "w") as f:
-                    json.dump(cookies, f, indent=4)
-                print(f"[SessionManager] Saved {len(cookies)} cookies to {self.cookie_file}")
-            except Exception as e:
-                print(f"[SessionManager] Error saving cookies: {str(e)}")
+    async def save_cookies(self, cookies: List[Dict]) -> bool:
+        """Save cookies to file asynchronously. Returns False if the write failed."""
+        # Write to a unique temp file and swap it in, so a crash mid-write
+        # never leaves a torn cookie file behind
+        tmp_file = self.cookie_file.with_name(f"{self.cookie_file.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            data = json.dumps(cookies, separators=(',', ':'), default=str).encode()
+            async with async_open(tmp_file, "wb") as f:
+                await f.write(data)
+            os.replace(tmp_file, self.cookie_file)
+            mtime = self.cookie_file.stat().st_mtime_ns
+            async with self.lock:
+                self.cookies = cookies
+                self._cookies_mtime = mtime
+            logger.debug("Saved %d cookies to %s", len(cookies), self.cookie_file)
+            return True
+        except Exception as e:
+            tmp_file.unlink(missing_ok=True)
+            logger.error("Error saving cookies: %s", e)
+            return False
 
     async def should_refresh(self) -> bool:
         """Check if session should be refreshed based on run count."""
-        async with self.lock:
-            self.run_count += 1
-            if self.run_count >= self.refresh_interval:
-                self.run_count = 0
-                self.refresh_interval = random.randint(8, 10)  # Randomize for next cycle
-                self.last_refresh = datetime.now()
-                print(f"[SessionManager] Refresh triggered after {self.refresh_interval} runs")
-                return True
-            return False
+        # No lock: there is no await between the increment and the reset, so
+        # on the single-threaded event loop this check cannot interleave
+        self.run_count += 1
+        if self.run_count >= self.refresh_interval:
+            runs = self.run_count
+            self.run_count = 0
+            self.refresh_interval = self._next_refresh_interval()  # Randomize for next cycle
+            self.last_refresh = time.monotonic()
+            logger.info("Refresh triggered after %d runs", runs)
+            return True
+        return False
 
 # Global instance
 session_manager = SessionManager()
\ No newline at end of file
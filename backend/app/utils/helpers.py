@@ -1,8 +1,42 @@
 import re
+from functools import lru_cache
 from typing import Optional, List, Dict
 from datetime import datetime
-import json
 import os
+import time
+import orjson
+
+# Compiled once at import; these run for every scraped username and bio
+_USERNAME_RE = re.compile(r'[a-zA-Z0-9._]{1,30}')  # Used with fullmatch
+_FOLLOWER_RE = re.compile(r'(\d+\.?\d*)([kmb]?)')
+_FOLLOWER_MULTIPLIERS = {
+    'k': 1000,
+    'm': 1000000,
+    'b': 1000000000
+}
+# Bounded quantifiers (RFC length caps) and dot-terminated domain labels keep
+# matching linear on bios with long runs of dots or dashes
+_EMAIL_RE = re.compile(
+    r'\b[A-Za-z0-9._%+-]{1,64}@'
+    r'(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,24}\b'
+)
+
+# Optional country code (or a bare NANP 1), then area, exchange and line groups
+# with at most one space, dot or dash between groups, so a year, range or other
+# number next to a phone is never glued onto it. A bare 4-digit area needs a
+# trunk 0, otherwise runs like "1000 2000 3000" read as a phone
+_PHONE_PATTERN = (
+    r'(?<![\w+(])(?:\+\d{1,3}[ .-]?|1[ .-])?'
+    r'(?:\(\d{2,4}\)|\d{2,3}|0\d{3})[ .-]?\d{3,4}[ .-]?\d{4}(?![\w-])'
+)
+
+# One alternation over all contact kinds, so a bio is scanned once rather than
+# once per pattern; earlier alternatives win where matches overlap
+_CONTACT_RE = re.compile(
+    rf'(?P<email>{_EMAIL_RE.pattern})'
+    r'|(?P<url>(?:https?://|www\.)[^\s<>"\']{1,2048})'
+    rf'|(?P<phone>{_PHONE_PATTERN})'
+)
 
 def clean_username(username: str) -> str:
     """Clean and validate Instagram username"""
@@ -13,20 +47,50 @@ def clean_username(username: str) -> str:
     username = username.strip().lstrip('@')
     
     # Instagram username validation (1-30 characters, letters, numbers, periods, underscores)
-    if re.match(r'^[a-zA-Z0-9._]{1,30}$', username):
+    if _is_valid_username(username):
         return username
     return ""
 
+def _is_valid_username(username: str) -> bool:
+    """Check the username charset and length, skipping the regex for plain ASCII names"""
+    if len(username) > 30:
+        return False
+    # isascii() matters: isalnum() alone would also accept non-Latin letters
+    if username.isascii() and username.replace('.', '').replace('_', '').isalnum():
+        return True
+    return _USERNAME_RE.fullmatch(username) is not None
+
+def clean_usernames_batch(usernames: List[str]) -> List[str]:
+    """Clean a list of usernames, dropping the invalid ones"""
+    cleaned = []
+    for username in usernames:
+        if not username:
+            continue
+        username = username.strip().lstrip('@')
+        if _is_valid_username(username):
+            cleaned.append(username)
+    return cleaned
+
+@lru_cache(maxsize=4096)  # Scrapes see the same "1.2K"/"10M" strings over and over
 def parse_follower_count(follower_text: str) -> int:
     """Parse follower count from text (handles K, M, B suffixes and commas)"""
     if not follower_text:
         return 0
     
     # Remove commas and convert to lowercase
-    text = follower_text.replace(',', '').lower()
+    text = follower_text.replace(',', '').strip().lower()
+    
+    # Fast paths for the common "12345" and "1.5k" shapes; isascii() keeps
+    # non-ASCII digits (which isdigit() accepts but int() rejects) on the regex path
+    if text.isascii():
+        if text.isdigit():
+            return int(text)
+        number, suffix = text[:-1], text[-1:]
+        if suffix in _FOLLOWER_MULTIPLIERS and number.replace('.', '', 1).isdigit():
+            return int(float(number) * _FOLLOWER_MULTIPLIERS[suffix])
     
     # Extract number and suffix
-    match = re.search(r'(\d+\.?\d*)([kmb]?)', text)
+    match = _FOLLOWER_RE.search(text)
     if not match:
         return 0
     
@@ -34,13 +98,9 @@ def parse_follower_count(follower_text: str) -> int:
     suffix = match.group(2)
     
     # Apply multiplier based on suffix
-    multipliers = {
-        'k': 1000,
-        'm': 1000000,
-        'b': 1000000000
-    }
-    return int(num * multipliers.get(suffix, 1))
+    return int(num * _FOLLOWER_MULTIPLIERS.get(suffix, 1))
 
+@lru_cache(maxsize=8192)  # Follower counts cluster, so exports format the same values repeatedly
 def format_number(num: int) -> str:
     """Format number with commas for readability"""
     return f"{num:,}"
@@ -50,9 +110,26 @@ def extract_email_from_bio(bio: str) -> Optional[str]:
     if not bio:
         return None
     
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, bio)
-    return emails[0] if emails else None
+    match = _EMAIL_RE.search(bio)
+    return match.group(0) if match else None
+
+def extract_contacts(bio: str) -> Dict[str, List[str]]:
+    """Extract emails, URLs and phone numbers from bio text in a single scan"""
+    contacts = {'emails': {}, 'urls': {}, 'phones': {}}
+    if not bio:
+        return {kind: [] for kind in contacts}
+    
+    for match in _CONTACT_RE.finditer(bio):
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'url':
+            value = value.rstrip('.,;:!?)')
+        elif kind == 'phone' and sum(c.isdigit() for c in value) < 10:
+            continue  # Too short for a full number with area code
+        contacts[kind + 's'][value] = None
+    
+    # dicts dedupe while keeping first-seen order
+    return {kind: list(values) for kind, values in contacts.items()}
 
 def calculate_engagement_rate(likes: int, comments: int, followers: int) -> float:
     """Calculate engagement rate as percentage"""
@@ -60,17 +137,35 @@ def calculate_engagement_rate(likes: int, comments: int, followers: int) -> floa
         return 0.0
     return round(((likes + comments) / followers) * 100, 2)
 
+# Export folders already created by this process
+_CREATED_DIRS = set()
+
+# (epoch second, formatted stamp) of the last export; strftime only runs once per second
+_last_export_stamp = (0, '')
+
+def _export_timestamp() -> str:
+    """Local-time '%Y%m%d_%H%M%S' stamp for export filenames"""
+    global _last_export_stamp
+    now = int(time.time())
+    if now != _last_export_stamp[0]:
+        _last_export_stamp = (now, datetime.fromtimestamp(now).strftime('%Y%m%d_%H%M%S'))
+    return _last_export_stamp[1]
+
 def export_to_json(data: List[Dict], folder: str, name: str) -> str:
     """Export data to JSON file and return file path"""
     export_dir = os.path.join('data', folder)
-    os.makedirs(export_dir, exist_ok=True)
+    if export_dir not in _CREATED_DIRS:
+        os.makedirs(export_dir, exist_ok=True)
+        _CREATED_DIRS.add(export_dir)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = _export_timestamp()
     filename = f"{name}_{timestamp}.json"
     filepath = os.path.join(export_dir, filename)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, default=str)  # Handle datetime and ObjectId
+    # orjson encodes datetimes natively; default=str still covers ObjectId
+    payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    with open(filepath, 'wb') as f:
+        f.write(payload)
     
     print(f"✅ Exported to {filepath}")
     return filepath
@@ -88,5 +183,17 @@ if __name__ == "__main__":
     # Test extract_email_from_bio
     print(extract_email_from_bio("Contact me at test@example.com"))  # Output: "test@example.com"
     
+    # Test extract_contacts
+    print(extract_contacts("Mail jo@gmail.com, call +1 (555) 123-4567\nwww.jo.co/shop"))
+    # Output: {'emails': ['jo@gmail.com'], 'urls': ['www.jo.co/shop'], 'phones': ['+1 (555) 123-4567']}
+    print(extract_contacts("Est. 2015 555-123-4567")['phones'])
+    # Output: ['555-123-4567']
+    print(extract_contacts("Open 9-5 (555) 123-4567")['phones'])
+    # Output: ['(555) 123-4567']
+    print(extract_contacts("Call 555-123-4567 - 24/7")['phones'])
+    # Output: ['555-123-4567']
+    print(extract_contacts("DM for collabs 1000 2000 3000")['phones'])
+    # Output: []
+    
     # Test calculate_engagement_rate
     print(calculate_engagement_rate(100, 20, 1000))  # Output: 12.0
\ No newline at end of file